@@ -1,14 +1,86 @@
 import argparse
+import contextlib
+import importlib.util
+import logging
+import logging.handlers
 import os
+import queue
+import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# --- yt-dlp Python library import ---
-try:
-    import yt_dlp
-except ImportError:
-    print("The 'yt-dlp' Python library is not installed.")
-    print("Please install it in your Python environment (e.g., 'pip install yt-dlp').")
-    yt_dlp = None  # So the script can still be parsed, but download will fail
+logger = logging.getLogger('ytdlp_ios')
+
+# yt-dlp pulls in hundreds of extractor modules, so it is only imported once a
+# download actually starts; `-h` and usage errors stay fast.
+
+HOME_DIR = os.path.expanduser('~')
+DOCUMENTS_DIR = os.path.join(HOME_DIR, 'Documents')
+# yt-dlp keeps the player JS and signature functions here so they are reused
+# between runs. Deleting this folder is safe and forces a fresh download.
+CACHE_DIR = os.path.join(HOME_DIR, '.cache', 'yt-dlp-ios')
+# Extracted video metadata, keyed by URL
+META_CACHE_DIR = os.path.join(HOME_DIR, '.cache', 'yt-dlp-ios-meta')
+META_CACHE_EXPIRE = 24 * 60 * 60  # seconds
+
+# aria2c splits each download over many connections, which gets around YouTube's
+# per-connection throttling. Without it yt-dlp's native downloader is used.
+# aria2c only fetches http/https formats, one per run, so `http_chunk_size` does not
+# apply to them. DASH/HLS fragments are still fetched by yt-dlp (see --jobs).
+ARIA2C = shutil.which('aria2c')
+ARIA2C_ARGS = ['-c', '-j', '16', '-x', '16', '-s', '16', '-k', '1M', '--file-allocation=none', '--summary-interval=0']
+
+# Options shared by every download; `outtmpl` and the per-site options are added
+# in download_video_with_library
+BASE_YDL_OPTS = {
+    'extract_flat': 'discard_in_playlist',
+    'final_ext': 'mkv',
+    'fragment_retries': 10,
+    'ignoreerrors': 'only_download',
+    'merge_output_format': 'mkv',
+    'postprocessors': [
+        {'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mkv'},
+        # Joins multi-part videos with ffmpeg's concat demuxer and stream copy (no re-encode)
+        {'key': 'FFmpegConcat', 'only_multi_video': True, 'when': 'playlist'},
+    ],
+    'retries': 10,
+    'writeinfojson': True,
+    # Fetch progressive streams in 10 MiB ranged requests, which YouTube throttles
+    # less than one long request, and write them out in large blocks
+    'http_chunk_size': 10 * 1024 * 1024,
+    'buffersize': 1024 * 1024,
+    'continuedl': True,
+    'socket_timeout': 30,
+    'cachedir': CACHE_DIR,
+}
+# Prefer an MP4 (H.264) video + M4A (AAC) audio pair, the codecs iOS players handle
+# best, then fall back to any video + audio pair and finally to a single combined
+# format. Merging into mkv is a stream copy whichever pair is chosen.
+YOUTUBE_FORMAT = (
+    'bestvideo[height<=?1080][fps<=?60][vcodec!*=av0][ext=mp4]+bestaudio[ext=m4a]'
+    '/bestvideo[height<=?1080][fps<=?60][vcodec!*=av0]+bestaudio'
+    '/best'
+)
+
+
+def setup_logging():
+    """
+    Routes log records through a queue to a background thread that writes them to stderr,
+    so download threads never block on console output.
+    Returns the started QueueListener; stopping it flushes any remaining records.
+    """
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
 
 
 def get_documents_folder():
@@ -16,205 +88,363 @@ def get_documents_folder():
     Returns the path to the user's Documents folder.
     Creates the folder if it doesn't exist.
     """
-    # Get the home directory
-    home_dir = os.path.expanduser('~')
-    documents_folder = os.path.join(home_dir, 'Documents')
-
-    # Create the Documents folder if it doesn't exist
+    # Create the Documents and cache folders if they don't exist. Checking first
+    # costs a single stat in the common case instead of a mkdir attempt.
     try:
-        os.makedirs(documents_folder, exist_ok=True)
+        if not os.path.isdir(DOCUMENTS_DIR):
+            os.makedirs(DOCUMENTS_DIR, exist_ok=True)
     except OSError as e:
-        print(f'Error creating Documents folder at {documents_folder}: {e}')
-        print('Please ensure you have permissions to create this directory, or create it manually.')
+        logger.error(f'Error creating Documents folder at {DOCUMENTS_DIR}: {e}')
+        logger.error('Please ensure you have permissions to create this directory, or create it manually.')
         return None
-    return documents_folder
+    # Downloads work without the cache, they are just slower to start
+    try:
+        if not os.path.isdir(CACHE_DIR):
+            os.makedirs(CACHE_DIR, exist_ok=True)
+    except OSError as e:
+        logger.warning(f'Could not create the cache folder at {CACHE_DIR}, continuing without it: {e}')
+    return DOCUMENTS_DIR
+
 
+# --- Optional metadata cache ---
+# diskcache is imported and the cache opened on first use, so `-h` stays fast
+# and has no side effects
+_meta_cache = None
+_meta_cache_lock = threading.Lock()
 
-def download_video_with_library(url, output_dir, is_youtube=True):
+
+def get_meta_cache():
     """
-    Downloads video from the given URL using the yt-dlp Python library.
-    Saves the video into the specified output_dir.
-    Returns the full path to the downloaded video file, or None on failure.
+    Returns the on-disk metadata cache, opening it on first use.
+    Returns None if diskcache is not installed.
     """
-    if not yt_dlp:
-        print('yt-dlp library not imported, cannot download video.')
-        return None
+    global _meta_cache
+    with _meta_cache_lock:
+        if _meta_cache is None:
+            try:
+                from diskcache import Cache
+            except ImportError:
+                _meta_cache = False  # Metadata is simply fetched afresh on every run
+            else:
+                _meta_cache = Cache(META_CACHE_DIR)
+    # Compare explicitly: an empty Cache is falsy
+    return None if _meta_cache is False else _meta_cache
 
-    # Define the output template for the filename within the output_dir
-    output_template = os.path.join(output_dir, '%(title)s.%(ext)s')
 
-    if is_youtube:
-        ydl_opts = {
-            'format': 'bestvideo[height<=?1080][fps<=?60][vcodec!*=av0]+bestaudio/best',
-            'outtmpl': output_template,
-            'noplaylist': False,
-            'quiet': False,
-            'extract_flat': 'discard_in_playlist',
-            'final_ext': 'mkv',
-            'fragment_retries': 10,
-            'ignoreerrors': 'only_download',
-            'merge_output_format': 'mkv',
-            'postprocessors': [
-                {'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mkv'},
-                {'key': 'FFmpegConcat', 'only_multi_video': True, 'when': 'playlist'},
-            ],
-            'retries': 10,
-        }
-    else:
-        ydl_opts = {
-            'outtmpl': output_template,
-            'noplaylist': True,
-            'quiet': False,
-            'extract_flat': 'discard_in_playlist',
-            'final_ext': 'mkv',
-            'fragment_retries': 10,
-            'ignoreerrors': 'only_download',
-            'merge_output_format': 'mkv',
-            'postprocessors': [
-                {'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mkv'},
-                {'key': 'FFmpegConcat', 'only_multi_video': True, 'when': 'playlist'},
-            ],
-            'retries': 10,
-        }
+@contextlib.contextmanager
+def raising_errors(ydl):
+    """
+    Makes ydl raise DownloadError for every error inside the block, instead of only
+    reporting the errors `ignoreerrors` covers.
+    """
+    ignoreerrors = ydl.params['ignoreerrors']
+    ydl.params['ignoreerrors'] = False
+    try:
+        yield
+    finally:
+        ydl.params['ignoreerrors'] = ignoreerrors
+
+
+def extract_metadata(ydl, url):
+    """
+    Extracts the metadata for the given URL with the worker's YoutubeDL instance, so
+    extraction shares its options and connections. Nothing is processed: formats are
+    selected and playlist entries extracted when the URL is downloaded.
+    Returns a sanitized (JSON-serializable) info dict.
+    """
+    with raising_errors(ydl):
+        info_dict = ydl.extract_info(url, download=False, process=False)
+    if 'entries' in info_dict:
+        # Entries may be a generator or a paged list, which sanitize_info cannot store
+        info_dict['entries'] = list(info_dict['entries'] or [])
+    return ydl.sanitize_info(info_dict)
+
+
+def fetch_info(ydl, url):
+    """
+    Returns the metadata for the given URL (see extract_metadata) and whether it came from the cache.
+    When diskcache is installed, results are cached on disk for META_CACHE_EXPIRE seconds.
+    """
+    meta_cache = get_meta_cache()
+    if meta_cache is None:
+        return extract_metadata(ydl, url), False
+
+    key = (url, ydl.params['noplaylist'])
+    info_dict = meta_cache.get(key)
+    if info_dict is not None:
+        return info_dict, True
+    info_dict = extract_metadata(ydl, url)
+    meta_cache.set(key, info_dict, expire=META_CACHE_EXPIRE)
+    return info_dict, False
+
+
+def get_downloaded_filepaths(info_dict, finished_files):
+    """
+    Returns the files yt-dlp wrote for info_dict that exist on disk.
+    `finished_files` holds the final path (after merging and remuxing) reported by the
+    post hook for every video, including each entry of a playlist; a multi-part video
+    joined by FFmpegConcat records the joined file in `requested_downloads` instead.
+    """
+    filepaths = list(finished_files)
+    if info_dict:
+        filepaths += [download.get('filepath') for download in info_dict.get('requested_downloads') or []]
+    return [filepath for filepath in dict.fromkeys(filepaths) if filepath and os.path.exists(filepath)]
+
+
+def download_url(ydl, url, finished_files):
+    """
+    Downloads a single URL with an already configured YoutubeDL instance whose
+    post hook appends each finished file to `finished_files`.
+    Returns the full paths of the downloaded video files (several for a playlist), or None on failure.
+    """
+    import yt_dlp
 
     try:
-        print(f'Starting download for URL: {url} with yt-dlp library.')
-        print(f'Video will be saved to: {output_dir}')
-        # print(f"Output options: {ydl_opts}") # Can be verbose
+        logger.info(f'Starting download for URL: {url} with yt-dlp library.')
 
-        downloaded_filepath = None
+        # Normalize the URL so the metadata cache gets one entry per video
+        url = url.strip()
+        noplaylist = ydl.params['noplaylist']
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # Get video info (optional, but good for getting the expected filename)
+        # Download from the (possibly cached) metadata
+        info_dict, from_cache = fetch_info(ydl, url)
+        finished_files.clear()
+        if info_dict.get('_type') == 'playlist':
+            # The entries are only extracted now, so no cached stream URL is involved
+            info_dict = ydl.process_ie_result(info_dict, download=True)
+        else:
             try:
-                info_dict = ydl.extract_info(url, download=False)
-                expected_filepath_template = ydl.prepare_filename(info_dict)
-                print(f'Anticipated file path: {expected_filepath_template}')
-            except Exception as e_info:
-                print(f'Could not pre-fetch video info (will proceed with download): {e_info}')
-                # Fallback: construct a generic expected path if info extraction fails
-                # This is less reliable as title and ext are unknown here.
-                # The actual filename will be determined after download.
-                expected_filepath_template = os.path.join(output_dir, 'downloaded_video')
-
-            # Start the download
-            error_code = ydl.download([url])
-
-            if error_code == 0:
-                # The download was successful.
-                # The most reliable way to get the filename is to check what file was actually created,
-                # especially if the title had special characters.
-                # `prepare_filename` on the info_dict *after* download (if info_dict was updated)
-                # or by listing the directory.
-
-                # If `extract_info` was run with `download=True`, `info_dict.get('filepath')` might be populated.
-                # Since we did download=False then ydl.download(), we find the file.
-
-                # Let's try to use the `expected_filepath_template` if it exists.
-                # yt-dlp might have slightly modified it (e.g. replacing invalid chars).
-                if os.path.exists(expected_filepath_template):
-                    downloaded_filepath = expected_filepath_template
-                else:
-                    # Fallback: Scan the directory if the exact expected path isn't found
-                    # This is helpful if the title processing by yt-dlp changed the name slightly
-                    # or if `expected_filepath_template` was a generic one.
-                    files_in_output_dir = os.listdir(output_dir)
-                    video_files = [
-                        f
-                        for f in files_in_output_dir
-                        if f.lower().endswith(
-                            ('.mp4', '.mkv', '.webm', '.mov', '.avi', '.flv')
-                        )  # Common video extensions
-                    ]
-
-                    if not video_files:
-                        print('Download reported success, ' + 'but no video files found in the output directory.')
-                        return None
-
-                    # If there are multiple video files, it's ambiguous.
-                    # We can try to find one that matches the expected title somewhat,
-                    # or just pick one.
-                    # For simplicity, if `expected_filepath_template` didn't work,
-                    # and there's only one video, use it.
-                    if len(video_files) == 1:
-                        downloaded_filepath = os.path.join(output_dir, video_files[0])
-                        print(
-                            f'Note: Using detected video file: {downloaded_filepath} '
-                            + f'(expected path was {expected_filepath_template})'
-                        )
-                    elif video_files:  # Multiple video files
-                        print(
-                            f'Warning: Multiple video files found in {output_dir}.'
-                            + f' This script will use the first one detected: {video_files[0]}'
-                        )
-                        print(
-                            'Consider refining "outtmpl" or checking the directory if '
-                            + 'this is not the desired file.'
-                        )
-                        downloaded_filepath = os.path.join(
-                            output_dir, video_files[0]
-                        )  # Or implement more sophisticated logic
-                    else:  # No video files after all
-                        print('Download reported success, ' + 'but could not identify the primary video file.')
-                        return None
-
-                if downloaded_filepath and os.path.exists(downloaded_filepath):
-                    print(f'Download successful. Video saved to: {downloaded_filepath}')
-                    return downloaded_filepath
-                else:
-                    # This case should ideally not be reached if error_code was 0
-                    print('Error: Download reported success,' + 'but the final file path could not be confirmed.')
-                    print(f'Checked expected path: {expected_filepath_template}')
-                    return None
-            else:
-                print(f'yt-dlp download failed with error code: {error_code}')
-                return None
+                # Let download errors raise so a stale cache entry can be told apart
+                with raising_errors(ydl):
+                    info_dict = ydl.process_ie_result(info_dict, download=True)
+            except yt_dlp.utils.DownloadError as e:
+                # The stream URLs in cached metadata expire after a few hours, which shows up
+                # as an HTTP or network error. Anything else (e.g. a failed merge or remux),
+                # or a failure after a file was finished, is not fixed by extracting again.
+                exc = e.exc_info[1]
+                if (
+                    not from_cache
+                    or finished_files
+                    or (exc is not None and not isinstance(exc, yt_dlp.networking.exceptions.network_exceptions))
+                ):
+                    raise
+                logger.warning('Download failed, extracting the video info again in case the cached one is stale.')
+                info_dict = extract_metadata(ydl, url)
+                get_meta_cache().set((url, noplaylist), info_dict, expire=META_CACHE_EXPIRE)
+                info_dict = ydl.process_ie_result(info_dict, download=True)
+        downloaded_filepaths = get_downloaded_filepaths(info_dict, finished_files)
 
+        if downloaded_filepaths:
+            for downloaded_filepath in downloaded_filepaths:
+                logger.info(f'Download successful. Video saved to: {downloaded_filepath}')
+            return downloaded_filepaths
+        else:
+            logger.error('The downloaded file could not be found.')
+            return None
     except yt_dlp.utils.DownloadError as e:
-        print(f'A yt-dlp download error occurred: {e}')
+        logger.error(f'A yt-dlp download error occurred: {e}')
         return None
     except Exception as e:
-        print(f'An unexpected error occurred during library-based download: {e}')
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f'An unexpected error occurred during library-based download: {e}')
         return None
 
 
+def make_progress_hook(interval=0.5):
+    """
+    Returns a yt-dlp progress hook that logs the download progress at most once every `interval` seconds.
+    Used instead of yt-dlp's own progress line, which is rewritten for every chunk received.
+    """
+    last_log = 0.0
+
+    def progress_hook(d):
+        nonlocal last_log
+        if d['status'] != 'downloading':
+            return
+        now = time.monotonic()
+        if now - last_log < interval:
+            return
+        last_log = now
+
+        name = os.path.basename(d.get('filename', ''))
+        downloaded = d.get('downloaded_bytes') or 0
+        total = d.get('total_bytes') or d.get('total_bytes_estimate')
+        if total:
+            logger.info(f'{name}: {downloaded / total:.1%} of {total / 2**20:.1f} MiB')
+        else:
+            logger.info(f'{name}: {downloaded / 2**20:.1f} MiB')
+
+    return progress_hook
+
+
+def create_youtube_dl(ydl_opts):
+    """
+    Returns a YoutubeDL instance for ydl_opts.
+    If yt-dlp cannot use the requested browser impersonation (for example with an
+    unsupported curl_cffi version), the instance is created without it.
+    """
+    import yt_dlp
+
+    try:
+        return yt_dlp.YoutubeDL(ydl_opts)
+    except yt_dlp.utils.YoutubeDLError as e:
+        # Only an unavailable impersonate target is recoverable; report anything else as is
+        if 'impersonate' not in ydl_opts or 'Impersonate target' not in str(e):
+            raise
+        logger.warning(f'Browser impersonation is not available, continuing without it: {e}')
+        return yt_dlp.YoutubeDL({key: value for key, value in ydl_opts.items() if key != 'impersonate'})
+
+
+def download_video_with_library(urls, output_dir, is_youtube=True, jobs=8, verbose=False):
+    """
+    Downloads videos from the given URLs using the yt-dlp Python library.
+    Saves the videos into the specified output_dir.
+    All URLs share one YoutubeDL instance, so extractors, caches and connections are reused.
+    Up to `jobs` DASH/HLS fragments are fetched in parallel.
+    yt-dlp's own output is only shown when `verbose` is set.
+    Returns a list with the full paths of the video files downloaded for each URL
+    (None on failure), in the same order as `urls`.
+    """
+    try:
+        import yt_dlp  # noqa: F401 - only checks that the library is available
+    except ImportError:
+        logger.error('yt-dlp library not imported, cannot download video.')
+        return [None] * len(urls)
+
+    ydl_opts = {
+        **BASE_YDL_OPTS,
+        # Naming files after the video ID keeps the path predictable; the title
+        # and other metadata go to the `<id>.info.json` written next to it
+        'outtmpl': os.path.join(output_dir, '%(id)s.%(ext)s'),
+        'noplaylist': not is_youtube,
+        'concurrent_fragment_downloads': jobs,
+        'quiet': not verbose,
+        'verbose': verbose,
+        'no_warnings': not verbose,
+        'noprogress': not verbose,
+    }
+    finished_files = []
+    ydl_opts['post_hooks'] = [finished_files.append]
+    if not verbose:
+        ydl_opts['progress_hooks'] = [make_progress_hook()]
+    if ARIA2C:
+        ydl_opts['external_downloader'] = {'default': ARIA2C}
+        ydl_opts['external_downloader_args'] = {'aria2c': ARIA2C_ARGS}
+    if importlib.util.find_spec('curl_cffi'):
+        # curl_cffi keeps HTTP/2 connections alive across the whole batch. yt-dlp
+        # only supports some curl_cffi versions; create_youtube_dl falls back if
+        # the installed one is rejected.
+        from yt_dlp.networking.impersonate import ImpersonateTarget
+
+        ydl_opts['impersonate'] = ImpersonateTarget('chrome')
+    if is_youtube:
+        ydl_opts['format'] = YOUTUBE_FORMAT
+
+    logger.info(f'Videos will be saved to: {output_dir}')
+    # logger.info(f"Output options: {ydl_opts}") # Can be verbose
+
+    try:
+        ydl = create_youtube_dl(ydl_opts)
+    except Exception as e:
+        logger.exception(f'Could not set up yt-dlp: {e}')
+        return [None] * len(urls)
+
+    with ydl:
+        return [download_url(ydl, url, finished_files) for url in urls]
+
+
+def get_video_key(url):
+    """
+    Returns a key that is the same for every URL of a video, e.g. a youtu.be link and
+    the matching watch?v= link: the extractor that handles the URL and the video ID it
+    matches, or the URL itself if the extractor cannot tell the ID from the URL alone.
+    """
+    from yt_dlp.extractor import gen_extractor_classes
+
+    for ie in gen_extractor_classes():
+        if ie.suitable(url):
+            return ie.ie_key(), ie.get_temp_id(url) or url
+    return None, url
+
+
 def main():
+    """
+    Command-line entry point. Returns the process exit code: 0 if every video
+    was downloaded, 1 otherwise.
+    """
     parser = argparse.ArgumentParser(
-        description='Download a video using the yt-dlp Python ' + 'library and save it to your Documents folder.'
+        description='Download a video using the yt-dlp Python ' + 'library and save it to your Documents folder.',
+        epilog='Example: python main.py "https://www.youtube.com/watch?v=dQw4w9WgXcQ"',
     )
-    parser.add_argument('url', help='The URL of the video to download.')
+    parser.add_argument('urls', nargs='+', metavar='url', help='The URL(s) of the videos to download.')
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=8,
+        help='Number of fragments to download in parallel (default: 8).',
+    )
+    parser.add_argument('-v', '--verbose', action='store_true', help="Show yt-dlp's full output.")
 
     args = parser.parse_args()
-    video_url = args.url
-    is_youtube = 'youtube.com' in video_url or 'youtu.be' in video_url
 
-    if not yt_dlp:  # Check if library was successfully imported
-        print('Exiting because yt-dlp library is not available.')
-        sys.exit(1)
+    listener = setup_logging()
+    try:
+        if not importlib.util.find_spec('yt_dlp'):  # Check the library is installed without importing it
+            logger.error("The 'yt-dlp' Python library is not installed.")
+            logger.error("Please install it in your Python environment (e.g., 'pip install yt-dlp').")
+            logger.error('Exiting because yt-dlp library is not available.')
+            return 1
+
+        # Get the user's Documents folder
+        documents_folder = get_documents_folder()
+        if not documents_folder:
+            logger.error('Could not determine or create Documents folder. Exiting.')
+            return 1
+
+        logger.info(f'Attempting to save video to: {documents_folder}')
+
+        # Drop repeated videos, even when given as different URLs, so two workers
+        # never write the same file. The first URL given for each video is kept.
+        video_urls = {}
+        for url in args.urls:
+            url = url.strip()
+            video_urls.setdefault(get_video_key(url), url)
+        video_urls = list(video_urls.values())
 
-    # Get the user's Documents folder
-    documents_folder = get_documents_folder()
-    if not documents_folder:
-        print('Could not determine or create Documents folder. Exiting.')
-        sys.exit(1)
+        # YouTube and other sites need different options, so each gets its own batches
+        youtube_urls = [url for url in video_urls if 'youtube.com' in url or 'youtu.be' in url]
+        other_urls = [url for url in video_urls if url not in youtube_urls]
 
-    print(f'Attempting to save video to: {documents_folder}')
+        # Split each batch between the workers. Every worker owns a YoutubeDL instance,
+        # so one video's ffmpeg merge overlaps with the download of the next one.
+        max_workers = os.cpu_count() or 1
+        batches = []
+        for urls, is_youtube in ((youtube_urls, True), (other_urls, False)):
+            workers = min(len(urls), max_workers)
+            batches += [(urls[i::workers], is_youtube) for i in range(workers)]
 
-    # Use the new function
-    downloaded_file_path = download_video_with_library(video_url, documents_folder, is_youtube)
+        downloaded_file_paths = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    download_video_with_library, urls, documents_folder, is_youtube, args.jobs, args.verbose
+                ): urls
+                for urls, is_youtube in batches
+            }
+            for future in as_completed(futures):
+                downloaded_file_paths.update(zip(futures[future], future.result()))
+
+        for url in video_urls:
+            if downloaded_file_paths[url]:
+                for downloaded_file_path in downloaded_file_paths[url]:
+                    logger.info(f'Process complete. Video should be available at: {downloaded_file_path}')
+            else:
+                logger.error(f'Failed to download the video: {url}')
 
-    if downloaded_file_path:
-        print(f'\nProcess complete. Video should be available at: {downloaded_file_path}')
-    else:
-        print('\nFailed to download the video.')
+        return 0 if all(downloaded_file_paths.values()) else 1
+    finally:
+        listener.stop()
 
 
 if __name__ == '__main__':
-    if len(sys.argv) < 2:
-        print('Usage: python your_script_name.py <video_url>')
-        print('Example: python your_script_name.py "https://www.youtube.com/watch?v=dQw4w9WgXcQ"')  # Example URL
-        sys.exit(1)
-    main()
+    sys.exit(main())